@@ -42,5 +42,7 @@ STOCH_DETERIORATE_PROB = 0.35
 MAX_BEDS = 5
 MAX_STAFF_CAPACITY = 4
 
-# Random seed (None = fresh randomness each run)
+# Random seed (None = fresh randomness each run). A fixed seed makes the
+# sequence of games in a process reproducible; each new game, including a
+# restart, still draws different patients.
 RNG_SEED = None
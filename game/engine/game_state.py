@@ -9,7 +9,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
 
 from .config import (
     DifficultyLevel,
@@ -17,8 +19,12 @@ from .config import (
     INITIAL_STAFF_STRESS,
     INITIAL_REPUTATION,
     TOTAL_ROUNDS,
+    MIN_SURVIVAL_TO_WIN,
+    MAX_STAFF_STRESS_TO_WIN,
+    MIN_REPUTATION_TO_WIN,
     MAX_BEDS,
     MAX_STAFF_CAPACITY,
+    RNG_SEED,
 )
 
 
@@ -29,6 +35,27 @@ class SeverityLevel(Enum):
     CRITICAL = auto()
 
 
+# Severity levels ordered by the int index stored on Patient
+# (0 = MILD ... 3 = CRITICAL)
+SEVERITY_LEVELS = tuple(SeverityLevel)
+
+
+# Bit flags packed into Patient.status
+STATUS_ALIVE = 1
+STATUS_TREATED = 2
+STATUS_LEFT = 4
+
+
+# Process-wide root for new games' generators. Each game spawns its own
+# child, so restarts play a fresh game even when RNG_SEED is fixed, while
+# the sequence of games in a process stays reproducible.
+_SEED_SEQUENCE = np.random.SeedSequence(RNG_SEED)
+
+
+def _new_game_rng() -> np.random.Generator:
+    return np.random.default_rng(_SEED_SEQUENCE.spawn(1)[0])
+
+
 class TriageDecision(Enum):
     TREAT_NOW = auto()
     MONITOR = auto()
@@ -36,23 +63,48 @@ class TriageDecision(Enum):
     TRANSFER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Patient:
     id: int
     name: str
-    severity_visible: SeverityLevel
-    severity_hidden_true: SeverityLevel
+    severity_visible: int  # index into SEVERITY_LEVELS
+    severity_hidden_true: int  # index into SEVERITY_LEVELS
     arrival_round: int
 
-    is_treated: bool = False
-    is_alive: bool = True
-    has_left: bool = False
+    status: int = STATUS_ALIVE  # STATUS_* bit flags
+
+    # display_label() cache; name and visible severity never change
+    _label: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self.status & STATUS_ALIVE)
+
+    @property
+    def is_treated(self) -> bool:
+        return bool(self.status & STATUS_TREATED)
+
+    @property
+    def has_left(self) -> bool:
+        return bool(self.status & STATUS_LEFT)
+
+    @property
+    def visible_level(self) -> SeverityLevel:
+        return SEVERITY_LEVELS[self.severity_visible]
+
+    @property
+    def true_level(self) -> SeverityLevel:
+        return SEVERITY_LEVELS[self.severity_hidden_true]
 
     def display_label(self) -> str:
-        return f"{self.name} (appears {self.severity_visible.name.title()})"
+        if self._label is None:
+            self._label = f"{self.name} (appears {self.visible_level.name.title()})"
+        return self._label
 
 
-@dataclass
+@dataclass(slots=True)
 class HospitalState:
     available_beds: int = MAX_BEDS
     staff_capacity_this_round: int = MAX_STAFF_CAPACITY
@@ -62,17 +114,17 @@ class HospitalState:
     reputation: float = INITIAL_REPUTATION
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoundSummary:
     round_number: int
-    decisions: Dict[int, TriageDecision] = field(default_factory=dict)
-    patients_treated: List[int] = field(default_factory=list)
-    patients_died: List[int] = field(default_factory=list)
-    patients_deteriorated: List[int] = field(default_factory=list)
-    notes: List[str] = field(default_factory=list)
+    decisions: Dict[int, TriageDecision] = field(default_factory=dict, hash=False)
+    patients_treated: Tuple[int, ...] = ()
+    patients_died: Tuple[int, ...] = ()
+    patients_deteriorated: Tuple[int, ...] = ()
+    notes: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     difficulty: DifficultyLevel
     current_round: int = 1
@@ -81,31 +133,60 @@ class GameState:
     hospital: HospitalState = field(default_factory=HospitalState)
     next_patient_id: int = 1
 
-    def is_game_over(self) -> bool:
-        if self.current_round > TOTAL_ROUNDS:
-            return True
-
-        if self.hospital.survival_score <= 0:
-            return True
+    # Source of all randomness for this game, so games are independent
+    rng: np.random.Generator = field(
+        default_factory=_new_game_rng,
+        repr=False,
+        compare=False,
+    )
+
+    # Patients still in the system (alive and not transferred out)
+    active_patients: List[Patient] = field(
+        default_factory=list, init=False, repr=False
+    )
+    # Beds held by active, treated patients
+    occupied_beds: int = field(default=0, init=False)
+
+    # Patient lookup by id, kept in sync by add_patient()
+    _id_index: Dict[int, Patient] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Win/loss result, set once the game ends; the game never resumes after
+    _outcome: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._id_index = {p.id: p for p in self.patients}
+        self.active_patients = [
+            p
+            for p in self.patients
+            if p.status & (STATUS_ALIVE | STATUS_LEFT) == STATUS_ALIVE
+        ]
+        self.occupied_beds = sum(1 for p in self.active_patients if p.is_treated)
 
-        if self.hospital.staff_stress >= 100:
+    def is_game_over(self) -> bool:
+        if self._outcome is not None:
             return True
 
-        if self.hospital.reputation <= 0:
+        if (
+            self.current_round > TOTAL_ROUNDS
+            or self.hospital.survival_score <= 0
+            or self.hospital.staff_stress >= 100
+            or self.hospital.reputation <= 0
+        ):
+            self._outcome = self._player_won()
             return True
 
         return False
 
     def has_player_won(self) -> Optional[bool]:
-        from .config import (
-            MIN_SURVIVAL_TO_WIN,
-            MAX_STAFF_STRESS_TO_WIN,
-            MIN_REPUTATION_TO_WIN,
-        )
-
         if not self.is_game_over():
             return None
+        return self._outcome
 
+    def _player_won(self) -> bool:
         # Win only if we survived all rounds
         if self.current_round <= TOTAL_ROUNDS:
             return False
@@ -122,18 +203,16 @@ class GameState:
     def add_round_summary(self, summary: RoundSummary) -> None:
         self.history.append(summary)
 
+    def add_patient(self, patient: Patient) -> None:
+        self.patients.append(patient)
+        self.active_patients.append(patient)
+        self._id_index[patient.id] = patient
+
     def get_patient_by_id(self, pid: int) -> Optional[Patient]:
-        for p in self.patients:
-            if p.id == pid:
-                return p
-        return None
+        return self._id_index.get(pid)
 
     def alive_patients(self) -> List[Patient]:
-        return [
-            p
-            for p in self.patients
-            if p.is_alive and not p.is_treated and not p.has_left
-        ]
+        return [p for p in self.active_patients if p.status == STATUS_ALIVE]
 
     def increment_round(self) -> None:
         self.current_round += 1
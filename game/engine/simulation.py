@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+simulation.py
+
+Headless Monte-Carlo replication of full games:
+- A simple baseline triage policy
+- Playing one game end-to-end from a seed
+- Running many independent games across worker processes
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import DifficultyLevel
+from .game_state import GameState, HospitalState, Patient, TriageDecision
+from .stochastic_model import (
+    apply_player_decisions,
+    generate_new_patients_for_round,
+)
+
+# A policy maps the round's new patients to triage decisions.
+# It must be a module-level function so worker processes can pickle it.
+Policy = Callable[[GameState, List[Patient]], Dict[int, TriageDecision]]
+
+
+def severity_first_policy(
+    game_state: GameState,
+    patients: List[Patient],
+) -> Dict[int, TriageDecision]:
+    """
+    Treat the patients who appear most severe while beds and staff last,
+    and monitor everyone else.
+    """
+    hospital = game_state.hospital
+    capacity = min(hospital.available_beds, hospital.staff_capacity_this_round)
+    ranked = sorted(patients, key=lambda p: p.severity_visible, reverse=True)
+
+    return {
+        p.id: TriageDecision.TREAT_NOW if i < capacity else TriageDecision.MONITOR
+        for i, p in enumerate(ranked)
+    }
+
+
+def play_game(
+    difficulty: DifficultyLevel,
+    seed: Optional[int] = None,
+    policy: Policy = severity_first_policy,
+) -> Tuple[bool, HospitalState]:
+    """
+    Play one full game with the given policy and return whether the
+    player won, plus the final hospital state.
+    """
+    game_state = GameState(difficulty=difficulty, rng=np.random.default_rng(seed))
+
+    while not game_state.is_game_over():
+        patients = generate_new_patients_for_round(game_state)
+        decisions = policy(game_state, patients)
+        summary = apply_player_decisions(game_state, decisions, explain=False)
+        game_state.add_round_summary(summary)
+        game_state.increment_round()
+
+    return bool(game_state.has_player_won()), game_state.hospital
+
+
+def simulate_games(
+    n: int,
+    difficulty: DifficultyLevel,
+    seeds: Optional[Sequence[int]] = None,
+    n_workers: Optional[int] = None,
+    policy: Policy = severity_first_policy,
+) -> List[Tuple[bool, HospitalState]]:
+    """
+    Play n independent games in parallel and return (won, final hospital
+    state) for each, in seed order.
+
+    Each game is seeded explicitly, so results are reproducible for a given
+    list of seeds regardless of how games are spread across workers. By
+    default ~90% of the available cores are used.
+    """
+    if seeds is None:
+        seeds = np.random.SeedSequence().generate_state(n).tolist()
+    elif len(seeds) != n:
+        raise ValueError(f"Expected {n} seeds, got {len(seeds)}.")
+
+    if n_workers is None:
+        n_workers = max(1, int((os.cpu_count() or 1) * 0.9))
+
+    play = partial(play_game, difficulty, policy=policy)
+
+    if n_workers == 1:
+        return [play(seed) for seed in seeds]
+
+    chunksize = max(1, n // (n_workers * 4))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(play, seeds, chunksize=chunksize))
@@ -13,8 +13,9 @@ Probabilistic behavior for the game:
 
 from __future__ import annotations
 
-from typing import List, Tuple, Dict
-import random
+from typing import List, Tuple, Dict, Optional
+
+import numpy as np
 
 from .config import (
     DifficultyLevel,
@@ -24,19 +25,44 @@ from .config import (
     STOCH_SEVERE_PROB,
     BASIC_DETERIORATE_PROB,
     STOCH_DETERIORATE_PROB,
-    RNG_SEED,
     MAX_BEDS,
 )
 from .game_state import (
     GameState,
     Patient,
     SeverityLevel,
+    SEVERITY_LEVELS,
+    STATUS_ALIVE,
+    STATUS_TREATED,
+    STATUS_LEFT,
     TriageDecision,
     RoundSummary,
 )
 
-# Single RNG instance so we can control seeding centrally
-_rng = random.Random(RNG_SEED)
+# Index of the lowest "high risk" severity (SEVERE and above)
+_SEVERE_IDX = SEVERITY_LEVELS.index(SeverityLevel.SEVERE)
+# Index of the worst severity; patients cannot deteriorate past it
+_CRITICAL_IDX = SEVERITY_LEVELS.index(SeverityLevel.CRITICAL)
+
+# Lookup tables shared by the helpers below
+_DEATH_BASE = {
+    SeverityLevel.MILD: 0.01,
+    SeverityLevel.MODERATE: 0.05,
+    SeverityLevel.SEVERE: 0.15,
+    SeverityLevel.CRITICAL: 0.30,
+}
+
+# Indexed by severity index
+_SEV_DESC = ("mild", "moderate", "severe", "critical")
+
+# Inside the engine, decisions are small int codes (TriageDecision.value - 1),
+# converted once per round in apply_player_decisions
+_TREAT_NOW = TriageDecision.TREAT_NOW.value - 1
+_DEFER = TriageDecision.DEFER.value - 1
+_TRANSFER = TriageDecision.TRANSFER.value - 1
+
+# Indexed by decision code
+_DECISION_LABEL = ("treat now", "monitor", "defer", "transfer")
 
 
 # ---------------------------------------------------------------------------
@@ -61,44 +87,30 @@ def _deterioration_probability(difficulty: DifficultyLevel) -> float:
     return STOCH_DETERIORATE_PROB
 
 
-def _sample_true_severity(severe_prob: float) -> SeverityLevel:
+def _sample_true_severity(
+    severe_prob: float,
+    u: np.ndarray,
+) -> np.ndarray:
     """
-    Simple two-bucket model:
+    Simple two-bucket model, sampled for n patients at once:
     - with probability severe_prob -> SEVERE or CRITICAL
     - otherwise -> MILD or MODERATE
-    """
-    x = _rng.random()
-    if x < severe_prob:
-        return SeverityLevel.SEVERE if _rng.random() < 0.6 else SeverityLevel.CRITICAL
-    else:
-        return SeverityLevel.MILD if _rng.random() < 0.5 else SeverityLevel.MODERATE
-
-
-def _severity_to_int(sev: SeverityLevel) -> int:
-    mapping = {
-        SeverityLevel.MILD: 0,
-        SeverityLevel.MODERATE: 1,
-        SeverityLevel.SEVERE: 2,
-        SeverityLevel.CRITICAL: 3,
-    }
-    return mapping[sev]
-
 
-def _int_to_severity(idx: int) -> SeverityLevel:
-    idx = max(0, min(3, idx))
-    if idx == 0:
-        return SeverityLevel.MILD
-    if idx == 1:
-        return SeverityLevel.MODERATE
-    if idx == 2:
-        return SeverityLevel.SEVERE
-    return SeverityLevel.CRITICAL
+    u is an (n, 3) array of uniform draws. Returns an int8 array of
+    severity indices (0 = MILD ... 3 = CRITICAL).
+    """
+    return np.where(
+        u[:, 0] < severe_prob,
+        2 + (u[:, 1] < 0.4).astype(np.int8),
+        (u[:, 2] < 0.5).astype(np.int8),
+    ).astype(np.int8)
 
 
 def _noisy_visible_severity(
-    true_severity: SeverityLevel,
+    true_idx: np.ndarray,
     difficulty: DifficultyLevel,
-) -> SeverityLevel:
+    u: np.ndarray,
+) -> np.ndarray:
     """
     Visible severity is a noisy observation of true severity.
 
@@ -107,28 +119,22 @@ def _noisy_visible_severity(
 
     STOCHASTIC:
         ~60% correct, 30% off by +/-1, 10% off by +/-2
+
+    Takes and returns int8 arrays of severity indices; u is an (n, 2)
+    array of uniform draws.
     """
-    true_idx = _severity_to_int(true_severity)
-    r = _rng.random()
+    r = u[:, 0]
+    sign = 1 - 2 * (u[:, 1] < 0.5)  # -1 or +1 with equal probability
 
     if difficulty == DifficultyLevel.BASIC:
-        if r < 0.8:
-            delta = 0
-        else:
-            delta = _rng.choice([-1, 1])
+        delta = np.where(r < 0.8, 0, sign)
     else:
-        if r < 0.6:
-            delta = 0
-        elif r < 0.9:
-            delta = _rng.choice([-1, 1])
-        else:
-            delta = _rng.choice([-2, 2])
+        delta = np.where(r < 0.6, 0, np.where(r < 0.9, sign, 2 * sign))
 
-    visible_idx = true_idx + delta
-    return _int_to_severity(visible_idx)
+    return np.clip(true_idx + delta, 0, _CRITICAL_IDX).astype(np.int8)
 
 
-def _death_probability(
+def _compute_death_probability(
     true_severity: SeverityLevel,
     treated: bool,
     decision: TriageDecision,
@@ -136,12 +142,7 @@ def _death_probability(
     """
     Per-round death probability based on severity and decision.
     """
-    base = {
-        SeverityLevel.MILD: 0.01,
-        SeverityLevel.MODERATE: 0.05,
-        SeverityLevel.SEVERE: 0.15,
-        SeverityLevel.CRITICAL: 0.30,
-    }[true_severity]
+    base = _DEATH_BASE[true_severity]
 
     if treated:
         # Treatment reduces risk but does not remove it
@@ -161,144 +162,225 @@ def _death_probability(
     return base
 
 
-def _update_metrics_for_patient_outcome(
-    game_state: GameState,
-    patient: Patient,
+# Every (severity, treated, decision) combination, precomputed once.
+# Index layout: (severity << 3) | (treated << 2) | decision, all 0-based.
+_DEATH_TABLE: Tuple[float, ...] = tuple(
+    _compute_death_probability(sev, treated, decision)
+    for sev in SEVERITY_LEVELS
+    for treated in (False, True)
+    for decision in TriageDecision
+)
+
+
+def _death_probability(
+    true_severity: int,
+    treated: bool,
+    decision: int,
+) -> float:
+    """
+    Per-round death probability based on severity index and decision code.
+    """
+    return _DEATH_TABLE[true_severity << 3 | treated << 2 | decision]
+
+
+def _compute_metric_deltas(
     died: bool,
     decision: TriageDecision,
-) -> None:
+    capacity_exhausted: bool,
+) -> Tuple[float, float, float]:
     """
-    Adjust survival_score, staff_stress, and reputation for this patient's outcome.
+    (survival_score, staff_stress, reputation) changes for one patient's
+    outcome. capacity_exhausted means no beds or no staff were left.
     """
-    hospital = game_state.hospital
+    survival = stress = reputation = 0.0
 
     if died:
-        hospital.survival_score -= 4.0
-        hospital.reputation -= 2.0
-        hospital.staff_stress += 3.0
+        survival -= 4.0
+        reputation -= 2.0
+        stress += 3.0
     else:
-        hospital.survival_score += 0.5
-        hospital.reputation += 0.5
+        survival += 0.5
+        reputation += 0.5
 
     # Decision load and optics
     if decision == TriageDecision.TREAT_NOW:
-        hospital.staff_stress += 1.0
-        hospital.reputation += 0.5
+        stress += 1.0
+        reputation += 0.5
     elif decision == TriageDecision.MONITOR:
-        hospital.staff_stress += 0.5
+        stress += 0.5
     elif decision == TriageDecision.DEFER:
-        hospital.reputation -= 1.0
+        reputation -= 1.0
     elif decision == TriageDecision.TRANSFER:
-        if hospital.available_beds <= 0 or hospital.staff_capacity_this_round <= 0:
-            hospital.reputation += 0.5
+        if capacity_exhausted:
+            reputation += 0.5
         else:
-            hospital.reputation -= 1.0
+            reputation -= 1.0
 
-    # Clamp metrics
-    hospital.survival_score = max(0.0, min(100.0, hospital.survival_score))
-    hospital.staff_stress = max(0.0, min(100.0, hospital.staff_stress))
-    hospital.reputation = max(0.0, min(100.0, hospital.reputation))
+    return survival, stress, reputation
 
 
-def _deteriorate_severity_if_needed(
+# Every (died, decision, capacity_exhausted) combination, precomputed once.
+# Index layout: (died << 3) | (decision << 1) | capacity_exhausted, 0-based.
+_METRIC_DELTAS: Tuple[Tuple[float, float, float], ...] = tuple(
+    _compute_metric_deltas(died, decision, exhausted)
+    for died in (False, True)
+    for decision in TriageDecision
+    for exhausted in (False, True)
+)
+
+
+def _update_metrics_for_patient_outcome(
     game_state: GameState,
     patient: Patient,
+    died: bool,
+    decision: int,
+) -> None:
+    """
+    Adjust survival_score, staff_stress, and reputation for this patient's
+    outcome, given the decision code. Each metric is clamped to [0, 100]
+    after every patient, so later patients in the round start from the
+    clamped value.
+    """
+    hospital = game_state.hospital
+    exhausted = (
+        hospital.available_beds <= 0 or hospital.staff_capacity_this_round <= 0
+    )
+    d_survival, d_stress, d_reputation = _METRIC_DELTAS[
+        died << 3 | decision << 1 | exhausted
+    ]
+
+    # Clamp metrics
+    survival = hospital.survival_score + d_survival
+    if survival < 0.0:
+        survival = 0.0
+    elif survival > 100.0:
+        survival = 100.0
+    hospital.survival_score = survival
+
+    stress = hospital.staff_stress + d_stress
+    if stress < 0.0:
+        stress = 0.0
+    elif stress > 100.0:
+        stress = 100.0
+    hospital.staff_stress = stress
+
+    reputation = hospital.reputation + d_reputation
+    if reputation < 0.0:
+        reputation = 0.0
+    elif reputation > 100.0:
+        reputation = 100.0
+    hospital.reputation = reputation
+
+
+def _deteriorate_untreated_patients(
+    patients: List[Patient],
     deterioration_prob: float,
-) -> bool:
+    rng: np.random.Generator,
+) -> List[Patient]:
     """
-    Possibly worsen a patient's true severity by one level.
-    Returns True if severity worsened.
+    Possibly worsen each patient's true severity by one level, using a
+    single batched draw for the whole group.
+    Returns the patients whose severity worsened.
     """
-    if not patient.is_alive or patient.is_treated or patient.has_left:
-        return False
+    if not patients:
+        return []
+
+    idx = np.fromiter(
+        (p.severity_hidden_true for p in patients),
+        dtype=np.int8,
+        count=len(patients),
+    )
+    draws = rng.random(len(patients))
+    worsen = (draws < deterioration_prob) & (idx < _CRITICAL_IDX)
+    new_idx = idx + worsen
 
-    if _rng.random() < deterioration_prob:
-        current_idx = _severity_to_int(patient.severity_hidden_true)
-        if current_idx < _severity_to_int(SeverityLevel.CRITICAL):
-            new_idx = current_idx + 1
-            patient.severity_hidden_true = _int_to_severity(new_idx)
-            return True
-    return False
+    worsened: List[Patient] = []
+    for patient, ni, w in zip(patients, new_idx.tolist(), worsen.tolist()):
+        if w:
+            patient.severity_hidden_true = ni
+            worsened.append(patient)
+    return worsened
 
 
-def _describe_severity(sev: SeverityLevel) -> str:
+def _describe_severity(sev: int) -> str:
     """Human-friendly severity description for explanations."""
-    mapping = {
-        SeverityLevel.MILD: "mild",
-        SeverityLevel.MODERATE: "moderate",
-        SeverityLevel.SEVERE: "severe",
-        SeverityLevel.CRITICAL: "critical",
-    }
-    return mapping[sev]
+    return _SEV_DESC[sev]
+
+
+def _assess_decision(decision: TriageDecision, true_severity: int) -> str:
+    """Basic assessment of a decision vs the patient's true severity."""
+    high_risk = true_severity >= _SEVERE_IDX
+    if decision == TriageDecision.TREAT_NOW and high_risk:
+        return "aligned with the high true risk"
+    if decision == TriageDecision.TREAT_NOW:
+        return "conservative, using resources on a lower-risk patient"
+    if decision in (TriageDecision.MONITOR, TriageDecision.DEFER) and high_risk:
+        return "risky given the underlying severity"
+    if decision == TriageDecision.TRANSFER and high_risk:
+        return "high-risk, depending on external capacity"
+    return "reasonable for the estimated risk"
+
+
+def _describe_uncertainty(visible_severity: int, true_severity: int) -> str:
+    """Commentary on how far the visible severity was from the true one."""
+    visible_text = _describe_severity(visible_severity)
+    if visible_severity != true_severity:
+        return (
+            f"Note: the patient appeared {visible_text}, "
+            f"but was actually {_describe_severity(true_severity)}, "
+            f"illustrating diagnostic uncertainty."
+        )
+    return (
+        f"In this case, the visible severity ({visible_text}) matched "
+        f"the true severity, so uncertainty played a smaller role."
+    )
+
+
+# Explanation fragments, precomputed once.
+# _QUALITY_TABLE[decision code][true_severity]
+_QUALITY_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(_assess_decision(decision, sev) for sev in range(len(SEVERITY_LEVELS)))
+    for decision in TriageDecision
+)
+
+# _UNCERTAINTY_TABLE[visible_severity][true_severity]
+_UNCERTAINTY_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(
+        _describe_uncertainty(visible, true)
+        for true in range(len(SEVERITY_LEVELS))
+    )
+    for visible in range(len(SEVERITY_LEVELS))
+)
+
+# Indexed by treated_this_round / died
+_TREATMENT_PART = (
+    "You did not allocate full treatment capacity this round.",
+    "You allocated scarce beds/staff to this patient.",
+)
+_OUTCOME_TEXT = ("survived this round", "died this round")
 
 
 def _explain_decision_and_outcome(
-    summary: RoundSummary,
+    notes: List[str],
     patient: Patient,
-    visible_severity: SeverityLevel,
-    true_severity_at_decision: SeverityLevel,
-    decision: TriageDecision,
+    visible_severity: int,
+    true_severity_at_decision: int,
+    decision: int,
     treated_this_round: bool,
     died: bool,
 ) -> None:
     """
     Generate an AI-style explanation string for this patient's outcome
-    and append it to summary.notes.
+    and append it to notes.
     """
     visible_text = _describe_severity(visible_severity)
     true_text = _describe_severity(true_severity_at_decision)
-    decision_label = {
-        TriageDecision.TREAT_NOW: "treat now",
-        TriageDecision.MONITOR: "monitor",
-        TriageDecision.DEFER: "defer",
-        TriageDecision.TRANSFER: "transfer",
-    }[decision]
-
-    outcome_text = "survived this round"
-    if died:
-        outcome_text = "died this round"
-
-    # Basic assessment of decision vs true severity
-    if decision == TriageDecision.TREAT_NOW and true_severity_at_decision in (
-        SeverityLevel.SEVERE,
-        SeverityLevel.CRITICAL,
-    ):
-        quality = "aligned with the high true risk"
-    elif decision == TriageDecision.TREAT_NOW and true_severity_at_decision in (
-        SeverityLevel.MILD,
-        SeverityLevel.MODERATE,
-    ):
-        quality = "conservative, using resources on a lower-risk patient"
-    elif decision in (TriageDecision.MONITOR, TriageDecision.DEFER) and true_severity_at_decision in (
-        SeverityLevel.SEVERE,
-        SeverityLevel.CRITICAL,
-    ):
-        quality = "risky given the underlying severity"
-    elif decision == TriageDecision.TRANSFER and true_severity_at_decision in (
-        SeverityLevel.SEVERE,
-        SeverityLevel.CRITICAL,
-    ):
-        quality = "high-risk, depending on external capacity"
-    else:
-        quality = "reasonable for the estimated risk"
+    decision_label = _DECISION_LABEL[decision]
 
-    # Uncertainty commentary
-    if visible_severity != true_severity_at_decision:
-        uncertainty_part = (
-            f"Note: the patient appeared {visible_text}, "
-            f"but was actually {true_text}, illustrating diagnostic uncertainty."
-        )
-    else:
-        uncertainty_part = (
-            f"In this case, the visible severity ({visible_text}) matched "
-            f"the true severity, so uncertainty played a smaller role."
-        )
-
-    treatment_part = (
-        "You allocated scarce beds/staff to this patient."
-        if treated_this_round
-        else "You did not allocate full treatment capacity this round."
-    )
+    outcome_text = _OUTCOME_TEXT[died]
+    quality = _QUALITY_TABLE[decision][true_severity_at_decision]
+    uncertainty_part = _UNCERTAINTY_TABLE[visible_severity][true_severity_at_decision]
+    treatment_part = _TREATMENT_PART[treated_this_round]
 
     explanation = (
         f"Patient {patient.id}: appeared {visible_text}, true severity {true_text}. "
@@ -307,130 +389,190 @@ def _explain_decision_and_outcome(
         f"{treatment_part} {uncertainty_part}"
     )
 
-    summary.notes.append(explanation)
+    notes.append(explanation)
 
 
-def _apply_environment_shocks(
+def _shock_staff_shortage(
     game_state: GameState,
-    summary: RoundSummary,
+    notes: List[str],
     base_deterioration_prob: float,
+    rng: np.random.Generator,
+    explain: bool,
 ) -> float:
-    """
-    In STOCHASTIC mode, introduce random environment events that
-    affect resources and risk for this round AND describe them narratively.
-
-    Returns the (possibly updated) deterioration probability.
-    """
-    if game_state.difficulty != DifficultyLevel.STOCHASTIC:
-        return base_deterioration_prob
-
+    """Staff shortage: thematic narrative + mechanical impact."""
     hospital = game_state.hospital
-    roll = _rng.random()
-
-    # ~20% chance each for three main shock types; otherwise no major shock.
-    if roll < 0.20:
-        # Staff shortage: thematic narrative + mechanical impact
-        original = hospital.staff_capacity_this_round
-        new_capacity = max(1, int(round(original * 0.6)))
-        hospital.staff_capacity_this_round = new_capacity
+    original = hospital.staff_capacity_this_round
+    new_capacity = max(1, int(round(original * 0.6)))
+    hospital.staff_capacity_this_round = new_capacity
 
-        summary.notes.append(
+    if explain:
+        notes.append(
             "Scenario: A respiratory virus has spread among hospital staff. "
             "Several nurses and residents call in sick just before the shift, "
             "forcing you to manage with fewer people on the floor."
         )
-        summary.notes.append(
+        notes.append(
             f"Environment event: unexpected staff shortage reduced staff capacity "
             f"from {original} to {new_capacity} this round, making 'Treat now' "
             f"decisions more expensive."
         )
+    return base_deterioration_prob
 
-    elif roll < 0.40:
-        # Bed outage: ward or equipment offline
-        original = hospital.available_beds
-        if original > 0:
-            reduction = max(1, original // 2)
-            new_beds = max(0, original - reduction)
-            hospital.available_beds = new_beds
 
-            summary.notes.append(
+def _shock_bed_outage(
+    game_state: GameState,
+    notes: List[str],
+    base_deterioration_prob: float,
+    rng: np.random.Generator,
+    explain: bool,
+) -> float:
+    """Bed outage: ward or equipment offline."""
+    hospital = game_state.hospital
+    original = hospital.available_beds
+    if original > 0:
+        reduction = max(1, original // 2)
+        new_beds = max(0, original - reduction)
+        hospital.available_beds = new_beds
+
+        if explain:
+            notes.append(
                 "Scenario: A burst pipe floods one of the surgical wards. "
                 "Facilities management has to close several rooms for emergency repairs, "
                 "leaving you with fewer usable beds."
             )
-            summary.notes.append(
+            notes.append(
                 f"Environment event: a ward outage made some beds unavailable "
                 f"({original} → {new_beds} beds) this round, tightening your "
                 f"capacity for new admissions."
             )
+    return base_deterioration_prob
+
 
-    elif roll < 0.60:
-        # Epidemic / mass-casualty spike: higher deterioration risk
-        new_prob = min(0.9, base_deterioration_prob * 1.7)
-        summary.notes.append(
+def _shock_surge(
+    game_state: GameState,
+    notes: List[str],
+    base_deterioration_prob: float,
+    rng: np.random.Generator,
+    explain: bool,
+) -> float:
+    """Epidemic / mass-casualty spike: higher deterioration risk."""
+    if explain:
+        notes.append(
             "Scenario: A multi-vehicle highway collision and a local festival outbreak "
             "hit the region at the same time. Incoming patients are more unstable, "
             "and those waiting in the hospital are at higher risk of sudden decline."
         )
-        summary.notes.append(
+        notes.append(
             "Environment event: deterioration risk for untreated patients increased "
             "this round due to the external surge in severe cases."
         )
-        base_deterioration_prob = new_prob
+    return min(0.9, base_deterioration_prob * 1.7)
 
-    else:
-        # No major shock, but still contextual narrative for immersion
-        quiet_roll = _rng.random()
-        if quiet_roll < 0.5:
-            summary.notes.append(
-                "Scenario: This round represents a relatively routine shift. "
-                "Uncertainty still exists at the patient level, but there are no "
-                "major external disruptions to hospital operations."
-            )
-        else:
-            summary.notes.append(
-                "Scenario: Community conditions are stable this round. "
-                "Your main challenge is triaging with incomplete information "
-                "rather than reacting to large external crises."
-            )
 
+def _shock_quiet(
+    game_state: GameState,
+    notes: List[str],
+    base_deterioration_prob: float,
+    rng: np.random.Generator,
+    explain: bool,
+) -> float:
+    """No major shock, but still contextual narrative for immersion."""
+    quiet_roll = rng.random()
+    if explain and quiet_roll < 0.5:
+        notes.append(
+            "Scenario: This round represents a relatively routine shift. "
+            "Uncertainty still exists at the patient level, but there are no "
+            "major external disruptions to hospital operations."
+        )
+    elif explain:
+        notes.append(
+            "Scenario: Community conditions are stable this round. "
+            "Your main challenge is triaging with incomplete information "
+            "rather than reacting to large external crises."
+        )
     return base_deterioration_prob
 
 
+# ~20% chance each for three main shock types; otherwise no major shock.
+# Indexed by int(roll * 5) for a uniform roll in [0, 1).
+_SHOCK_HANDLERS = (
+    _shock_staff_shortage,
+    _shock_bed_outage,
+    _shock_surge,
+    _shock_quiet,
+    _shock_quiet,
+)
+
+
+def _apply_environment_shocks(
+    game_state: GameState,
+    notes: List[str],
+    base_deterioration_prob: float,
+    rng: np.random.Generator,
+    explain: bool = True,
+) -> float:
+    """
+    In STOCHASTIC mode, introduce random environment events that
+    affect resources and risk for this round AND describe them narratively
+    in notes. The narrative is skipped when explain is False; the mechanical effects
+    and random draws are the same either way.
+
+    Returns the (possibly updated) deterioration probability.
+    """
+    if game_state.difficulty != DifficultyLevel.STOCHASTIC:
+        return base_deterioration_prob
+
+    handler = _SHOCK_HANDLERS[int(rng.random() * len(_SHOCK_HANDLERS))]
+    return handler(game_state, notes, base_deterioration_prob, rng, explain)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def generate_new_patients_for_round(game_state: GameState) -> List[Patient]:
+def generate_new_patients_for_round(
+    game_state: GameState,
+    rng: Optional[np.random.Generator] = None,
+) -> List[Patient]:
     """
     Create a new batch of patients for the current round, based on difficulty.
+
+    Randomness comes from rng, defaulting to the game's own generator.
     """
+    if rng is None:
+        rng = game_state.rng
     difficulty = game_state.difficulty
     min_p, max_p = _patients_per_round(difficulty)
     severe_prob = _severe_probability(difficulty)
 
-    num_new = _rng.randint(min_p, max_p)
-    new_patients: List[Patient] = []
-
-    for _ in range(num_new):
-        true_severity = _sample_true_severity(severe_prob)
-        visible_severity = _noisy_visible_severity(true_severity, difficulty)
+    num_new = int(rng.integers(min_p, max_p + 1))
 
-        pid = game_state.next_patient_id
-        game_state.next_patient_id += 1
+    # All of the round's arrival randomness comes from a single draw
+    u = rng.random((num_new, 5))
+    true_idx = _sample_true_severity(severe_prob, u[:, :3])
+    visible_idx = _noisy_visible_severity(true_idx, difficulty, u[:, 3:])
 
-        name = f"Patient {pid}"
+    # Allocate the round's ids as one block, then build patients from the arrays
+    first_id = game_state.next_patient_id
+    game_state.next_patient_id += num_new
+    arrival_round = game_state.current_round
 
-        p = Patient(
+    new_patients = [
+        Patient(
             id=pid,
-            name=name,
+            name=f"Patient {pid}",
             severity_visible=visible_severity,
             severity_hidden_true=true_severity,
-            arrival_round=game_state.current_round,
+            arrival_round=arrival_round,
         )
-
-        game_state.patients.append(p)
-        new_patients.append(p)
+        for pid, true_severity, visible_severity in zip(
+            range(first_id, first_id + num_new),
+            true_idx.tolist(),
+            visible_idx.tolist(),
+        )
+    ]
+    for p in new_patients:
+        game_state.add_patient(p)
 
     return new_patients
 
@@ -438,126 +580,153 @@ def generate_new_patients_for_round(game_state: GameState) -> List[Patient]:
 def apply_player_decisions(
     game_state: GameState,
     decisions: Dict[int, TriageDecision],
+    explain: bool = True,
+    rng: Optional[np.random.Generator] = None,
 ) -> RoundSummary:
     """
     Apply player decisions, update patient outcomes and hospital metrics,
     and return a RoundSummary for the current round, including explanations
     and any stochastic environment events with narrative context.
+
+    Pass explain=False to skip building the explanation and narrative notes
+    (e.g. for batch simulations); game outcomes are unaffected. In that mode
+    the summary's decisions also reference the caller's dict instead of a copy.
+    Randomness comes from rng, defaulting to the game's own generator.
     """
-    summary = RoundSummary(round_number=game_state.current_round)
-    summary.decisions = dict(decisions)
+    if rng is None:
+        rng = game_state.rng
 
+    notes: List[str] = []
     hospital = game_state.hospital
     deterioration_prob = _deterioration_probability(game_state.difficulty)
 
     # Apply environmental randomness for this round (STOCHASTIC only)
     deterioration_prob = _apply_environment_shocks(
-        game_state, summary, deterioration_prob
+        game_state, notes, deterioration_prob, rng, explain
     )
 
-    # 1) Apply explicit decisions
-    for pid, decision in decisions.items():
-        patient = game_state.get_patient_by_id(pid)
-        if patient is None or not patient.is_alive or patient.has_left:
-            continue
-
+    # 1) Apply explicit decisions to patients still on site;
+    #    decisions become int codes and outcome rolls are drawn in one batch
+    valid = [
+        (pid, patient, decision.value - 1)
+        for pid, decision in decisions.items()
+        if (patient := game_state.get_patient_by_id(pid)) is not None
+        and patient.status & (STATUS_ALIVE | STATUS_LEFT) == STATUS_ALIVE
+    ]
+    rolls = rng.random(len(valid)).tolist()
+    treated_ids: List[int] = []
+    died_ids: List[int] = []
+    for (pid, patient, decision), roll in zip(valid, rolls):
         treated_this_round = False
 
         # Capture severities at the decision time for explanation
         true_severity_at_decision = patient.severity_hidden_true
         visible_at_decision = patient.severity_visible
 
-        if decision == TriageDecision.TREAT_NOW:
+        if decision == _TREAT_NOW:
             if hospital.staff_capacity_this_round > 0 and hospital.available_beds > 0:
                 treated_this_round = True
-                patient.is_treated = True
+                if not patient.status & STATUS_TREATED:
+                    game_state.occupied_beds += 1
+                patient.status |= STATUS_TREATED
                 hospital.staff_capacity_this_round -= 1
                 hospital.available_beds -= 1
-                summary.patients_treated.append(pid)
+                treated_ids.append(pid)
             else:
-                summary.notes.append(
-                    f"Patient {patient.id}: you attempted to treat, "
-                    f"but there were no beds or staff left, so the decision "
-                    f"effectively became 'defer'."
-                )
-                decision = TriageDecision.DEFER
-
-        elif decision == TriageDecision.TRANSFER:
-            patient.has_left = True
+                if explain:
+                    notes.append(
+                        f"Patient {patient.id}: you attempted to treat, "
+                        f"but there were no beds or staff left, so the decision "
+                        f"effectively became 'defer'."
+                    )
+                decision = _DEFER
+
+        elif decision == _TRANSFER:
+            patient.status |= STATUS_LEFT
+            if patient.status & STATUS_TREATED:
+                game_state.occupied_beds -= 1
             death_prob = _death_probability(
                 patient.severity_hidden_true, False, decision
             )
-            died = _rng.random() < death_prob
-            patient.is_alive = not died
+            died = roll < death_prob
             if died:
-                summary.patients_died.append(pid)
+                patient.status &= ~STATUS_ALIVE
+                died_ids.append(pid)
             _update_metrics_for_patient_outcome(
                 game_state, patient, died=died, decision=decision
             )
 
-            _explain_decision_and_outcome(
-                summary=summary,
-                patient=patient,
-                visible_severity=visible_at_decision,
-                true_severity_at_decision=true_severity_at_decision,
-                decision=decision,
-                treated_this_round=False,
-                died=died,
-            )
+            if explain:
+                _explain_decision_and_outcome(
+                    notes=notes,
+                    patient=patient,
+                    visible_severity=visible_at_decision,
+                    true_severity_at_decision=true_severity_at_decision,
+                    decision=decision,
+                    treated_this_round=False,
+                    died=died,
+                )
             continue
 
         # For treat / monitor / defer, compute outcome
         death_prob = _death_probability(
             patient.severity_hidden_true, treated_this_round, decision
         )
-        died = _rng.random() < death_prob
+        died = roll < death_prob
 
         if died:
-            patient.is_alive = False
-            summary.patients_died.append(pid)
+            patient.status &= ~STATUS_ALIVE
+            if patient.status & STATUS_TREATED:
+                game_state.occupied_beds -= 1
+            died_ids.append(pid)
 
         _update_metrics_for_patient_outcome(
             game_state, patient, died=died, decision=decision
         )
 
-        _explain_decision_and_outcome(
-            summary=summary,
-            patient=patient,
-            visible_severity=visible_at_decision,
-            true_severity_at_decision=true_severity_at_decision,
-            decision=decision,
-            treated_this_round=treated_this_round,
-            died=died,
-        )
+        if explain:
+            _explain_decision_and_outcome(
+                notes=notes,
+                patient=patient,
+                visible_severity=visible_at_decision,
+                true_severity_at_decision=true_severity_at_decision,
+                decision=decision,
+                treated_this_round=treated_this_round,
+                died=died,
+            )
 
-    # 2) Deterioration for in-hospital, untreated patients
-    for patient in game_state.patients:
-        if not patient.is_alive or patient.has_left:
-            continue
-        if patient.is_treated:
-            continue
+    # Drop patients who died or left this round from the active set
+    game_state.active_patients = [
+        p
+        for p in game_state.active_patients
+        if p.status & (STATUS_ALIVE | STATUS_LEFT) == STATUS_ALIVE
+    ]
 
-        worsened = _deteriorate_severity_if_needed(
-            game_state, patient, deterioration_prob
-        )
-        if worsened:
-            summary.patients_deteriorated.append(patient.id)
-            summary.notes.append(
+    # 2) Deterioration for in-hospital, untreated patients
+    worsened = _deteriorate_untreated_patients(
+        game_state.alive_patients(), deterioration_prob, rng
+    )
+    if explain:
+        for patient in worsened:
+            notes.append(
                 f"Patient {patient.id}: condition deteriorated due to the "
                 f"stochastic environment (random health changes over time). "
                 f"This models how patients can worsen even without a new decision."
             )
 
     # 3) Recompute available beds
-    occupied_beds = 0
-    for p in game_state.patients:
-        if p.is_alive and p.is_treated and not p.has_left:
-            occupied_beds += 1
-    hospital.available_beds = max(0, MAX_BEDS - occupied_beds)
+    hospital.available_beds = max(0, MAX_BEDS - game_state.occupied_beds)
 
     # Final clamp
     hospital.survival_score = max(0.0, min(100.0, hospital.survival_score))
     hospital.staff_stress = max(0.0, min(100.0, hospital.staff_stress))
     hospital.reputation = max(0.0, min(100.0, hospital.reputation))
 
-    return summary
+    return RoundSummary(
+        round_number=game_state.current_round,
+        decisions=dict(decisions) if explain else decisions,
+        patients_treated=tuple(treated_ids),
+        patients_died=tuple(died_ids),
+        patients_deteriorated=tuple(p.id for p in worsened),
+        notes=tuple(notes),
+    )
@@ -5,6 +5,7 @@ Streamlit UI for the Medical Triage Decision Game.
 
 import os
 import sys
+from dataclasses import dataclass, field
 
 # Ensure project root (/Users/kenny/LukeTheDoctor) is on sys.path
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))          # .../game/ui
@@ -23,36 +24,139 @@ from game.engine.stochastic_model import (
 
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Display labels
 # ---------------------------------------------------------------------------
 
-def _init_game_if_needed(selected_difficulty: DifficultyLevel) -> None:
+_DIFFICULTY_LABELS = {
+    DifficultyLevel.BASIC: "Basic (more predictable)",
+    DifficultyLevel.STOCHASTIC: "Stochastic (higher uncertainty)",
+}
+
+_TRIAGE_LABELS = {
+    TriageDecision.TREAT_NOW: "Treat now (use beds and staff)",
+    TriageDecision.MONITOR: "Monitor this round",
+    TriageDecision.DEFER: "Defer (delay treatment)",
+    TriageDecision.TRANSFER: "Transfer to another facility",
+}
+_TRIAGE_BY_LABEL = {label: d for d, label in _TRIAGE_LABELS.items()}
+_DEFAULT_TRIAGE_LABEL = _TRIAGE_LABELS[TriageDecision.TREAT_NOW]
+
+# Column setup for the per-round triage table
+_TRIAGE_COLUMNS = {
+    "Patient": st.column_config.TextColumn("Patient"),
+    "Decision": st.column_config.SelectboxColumn(
+        "Decision",
+        options=list(_TRIAGE_LABELS.values()),
+        required=True,
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Session state
+# ---------------------------------------------------------------------------
+
+_BUNDLE_KEY = "_bundle"
+
+
+@dataclass
+class SessionBundle:
     """
-    Initialize or reset the GameState in Streamlit's session_state.
+    Everything the app keeps between reruns, stored under a single
+    session_state key so it is read, and replaced, in one step.
     """
-    if "game_state" not in st.session_state:
-        st.session_state.game_state = GameState(difficulty=selected_difficulty)
-        st.session_state.current_round_patient_ids = []
-        st.session_state.patients_generated_for_round = False
-        st.session_state.last_round_summary = None
-        st.session_state.difficulty = selected_difficulty
-        return
+    game_state: GameState
+    difficulty: DifficultyLevel
+    # One {"id", "label"} row per patient in the current round's form
+    current_round_view: list[dict] = field(default_factory=list)
+    patients_generated_for_round: bool = False
+    last_round_summary: RoundSummary | None = None
+    # Markdown body for last_round_summary, built once when the round resolves
+    last_round_markdown: str = ""
+
+
+def _new_bundle(difficulty: DifficultyLevel) -> SessionBundle:
+    bundle = SessionBundle(
+        game_state=GameState(difficulty=difficulty),
+        difficulty=difficulty,
+    )
+    st.session_state[_BUNDLE_KEY] = bundle
+    return bundle
 
-    # If difficulty changed, start a new game
-    if st.session_state.get("difficulty") != selected_difficulty:
-        st.session_state.game_state = GameState(difficulty=selected_difficulty)
-        st.session_state.current_round_patient_ids = []
-        st.session_state.patients_generated_for_round = False
-        st.session_state.last_round_summary = None
-        st.session_state.difficulty = selected_difficulty
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _init_game_if_needed(selected_difficulty: DifficultyLevel) -> SessionBundle:
+    """
+    Return the session's bundle, starting a new game on first run or when
+    the selected difficulty changed.
+    """
+    bundle = st.session_state.get(_BUNDLE_KEY)
+    if bundle is None or bundle.difficulty != selected_difficulty:
+        bundle = _new_bundle(selected_difficulty)
+    return bundle
 
 
 def _difficulty_label(level: DifficultyLevel) -> str:
-    if level == DifficultyLevel.BASIC:
-        return "Basic (more predictable)"
-    if level == DifficultyLevel.STOCHASTIC:
-        return "Stochastic (higher uncertainty)"
-    return level.name
+    return _DIFFICULTY_LABELS.get(level, level.name)
+
+
+def _generate_round_patients(bundle: SessionBundle) -> None:
+    """
+    Button callback: generate this round's patients.
+
+    Callbacks run before the script reruns, so the new patients show up
+    on that run without an extra st.rerun().
+    """
+    new_patients = generate_new_patients_for_round(bundle.game_state)
+    # Snapshot what the form needs; it cannot change until the round resolves
+    bundle.current_round_view = [
+        {"id": p.id, "label": p.display_label()}
+        for p in new_patients
+        if p.is_alive and not p.has_left
+    ]
+    bundle.patients_generated_for_round = True
+
+
+def _read_triage_decisions(
+    round_view: list[dict],
+    edited_rows: dict[int, dict],
+) -> dict[int, TriageDecision]:
+    """
+    Map the triage table's edits (row position -> changed cells) back to
+    a decision per patient id; untouched rows keep the default.
+    """
+    return {
+        row["id"]: _TRIAGE_BY_LABEL[
+            edited_rows.get(i, {}).get("Decision") or _DEFAULT_TRIAGE_LABEL
+        ]
+        for i, row in enumerate(round_view)
+    }
+
+
+def _resolve_round(bundle: SessionBundle, editor_key: str) -> None:
+    """
+    Form-submit callback: apply the chosen decisions and advance the round.
+    """
+    game_state = bundle.game_state
+    editor_state = st.session_state.get(editor_key)
+    edited_rows = editor_state["edited_rows"] if editor_state else {}
+    decisions = _read_triage_decisions(bundle.current_round_view, edited_rows)
+
+    if decisions:
+        summary = apply_player_decisions(game_state, decisions)
+    else:
+        summary = RoundSummary(round_number=game_state.current_round)
+
+    game_state.add_round_summary(summary)
+    bundle.last_round_summary = summary
+    bundle.last_round_markdown = _format_summary(summary)
+
+    game_state.increment_round()
+    bundle.current_round_view = []
+    bundle.patients_generated_for_round = False
 
 
 def _render_metrics(game_state: GameState) -> None:
@@ -67,11 +171,39 @@ def _render_metrics(game_state: GameState) -> None:
     col4.metric("Reputation", f"{h.reputation:.1f}")
 
 
-def _render_last_round_summary() -> None:
+def _format_summary(summary: RoundSummary) -> str:
+    """
+    Markdown body of a round summary: patient outcomes and AI feedback.
+    """
+    treated = summary.patients_treated
+    died = summary.patients_died
+    deteriorated = summary.patients_deteriorated
+    notes = summary.notes
+
+    lines = []
+    if treated:
+        lines.append(f"Treated patient IDs: {', '.join(map(str, treated))}")
+    if died:
+        lines.append(f"Patients who died: {', '.join(map(str, died))}")
+    if deteriorated:
+        lines.append(
+            f"Patients who deteriorated: {', '.join(map(str, deteriorated))}"
+        )
+
+    if notes:
+        lines.append("**AI feedback on your decisions this round:**")
+        lines.append("\n".join(f"- {note}" for note in notes))
+    elif not (treated or died or deteriorated):
+        lines.append("No significant events last round.")
+
+    return "\n\n".join(lines)
+
+
+def _render_last_round_summary(bundle: SessionBundle) -> None:
     """
     Show what happened in the previous round, including AI feedback.
     """
-    summary: RoundSummary | None = st.session_state.get("last_round_summary")
+    summary = bundle.last_round_summary
     if summary is None:
         return
 
@@ -79,38 +211,14 @@ def _render_last_round_summary() -> None:
         f"Last Round Summary (Round {summary.round_number})",
         expanded=False,
     ):
-        if summary.patients_treated:
-            st.write(
-                "Treated patient IDs:",
-                ", ".join(map(str, summary.patients_treated)),
-            )
-        if summary.patients_died:
-            st.write(
-                "Patients who died:",
-                ", ".join(map(str, summary.patients_died)),
-            )
-        if summary.patients_deteriorated:
-            st.write(
-                "Patients who deteriorated:",
-                ", ".join(map(str, summary.patients_deteriorated)),
-            )
-
-        if summary.notes:
-            st.markdown("**AI feedback on your decisions this round:**")
-            for note in summary.notes:
-                st.markdown(f"- {note}")
-        elif not (
-            summary.patients_treated
-            or summary.patients_died
-            or summary.patients_deteriorated
-        ):
-            st.write("No significant events last round.")
-
-
-def _render_game_over(game_state: GameState) -> None:
+        st.markdown(bundle.last_round_markdown)
+
+
+def _render_game_over(bundle: SessionBundle) -> None:
     """
     Show game-over message and a restart button.
     """
+    game_state = bundle.game_state
     result = game_state.has_player_won()
 
     if result is True:
@@ -129,11 +237,7 @@ def _render_game_over(game_state: GameState) -> None:
     _render_metrics(game_state)
 
     if st.button("Restart Game"):
-        current_diff = st.session_state.get("difficulty", DifficultyLevel.BASIC)
-        st.session_state.game_state = GameState(difficulty=current_diff)
-        st.session_state.current_round_patient_ids = []
-        st.session_state.patients_generated_for_round = False
-        st.session_state.last_round_summary = None
+        _new_bundle(bundle.difficulty)
         st.rerun()
 
 
@@ -157,8 +261,8 @@ def main() -> None:
         format_func=_difficulty_label,
     )
 
-    _init_game_if_needed(difficulty_choice)
-    game_state: GameState = st.session_state.game_state
+    bundle = _init_game_if_needed(difficulty_choice)
+    game_state = bundle.game_state
 
     st.sidebar.write(f"Current mode: {_difficulty_label(game_state.difficulty)}")
 
@@ -171,88 +275,75 @@ def main() -> None:
 
     # Check for terminal state
     if game_state.is_game_over():
-        _render_game_over(game_state)
+        _render_game_over(bundle)
         return
 
     # Dashboard
     _render_metrics(game_state)
-    _render_last_round_summary()
+    _render_last_round_summary(bundle)
 
     st.markdown("---")
     st.subheader(f"Round {game_state.current_round}: Incoming Patients")
 
     # Step 1: generate patients for this round
-    if not st.session_state.get("patients_generated_for_round", False):
-        if st.button("Generate Patients For This Round"):
-            new_patients = generate_new_patients_for_round(game_state)
-            st.session_state.current_round_patient_ids = [p.id for p in new_patients]
-            st.session_state.patients_generated_for_round = True
-            st.rerun()
-        else:
-            st.info("Click 'Generate Patients For This Round' to see new arrivals.")
-            return
+    if not bundle.patients_generated_for_round:
+        st.button(
+            "Generate Patients For This Round",
+            on_click=_generate_round_patients,
+            args=(bundle,),
+        )
+        st.info("Click 'Generate Patients For This Round' to see new arrivals.")
+        return
 
     # If we are here, patients for this round exist
-    current_ids = st.session_state.get("current_round_patient_ids", [])
+    round_view = bundle.current_round_view
 
-    if not current_ids:
+    editor_key = f"triage_editor_round_{game_state.current_round}"
+
+    # Nothing to decide: advance the round with a plain button, no form
+    if not round_view:
         st.warning(
             "No new patients arrived this round. "
             "You can proceed to the next round without decisions."
         )
-    else:
-        st.write(
-            "These patients have just arrived. Based on their visible "
-            "severity (which may be noisy), choose a triage decision for each."
+        st.button(
+            "Proceed To Next Round",
+            on_click=_resolve_round,
+            args=(bundle, editor_key),
         )
+        return
 
-    # Step 2: collect decisions in a form
-    decisions: dict[int, TriageDecision] = {}
-
-    with st.form(f"triage_form_round_{game_state.current_round}"):
-        for pid in current_ids:
-            patient = game_state.get_patient_by_id(pid)
-            if patient is None or not patient.is_alive or patient.has_left:
-                continue
-
-            st.markdown(f"**{patient.display_label()}**")
-            choice = st.radio(
-                f"Decision for patient {pid}",
-                key=f"decision_for_{pid}",
-                options=list(TriageDecision),
-                format_func=lambda d: {
-                    TriageDecision.TREAT_NOW: "Treat now (use beds and staff)",
-                    TriageDecision.MONITOR: "Monitor this round",
-                    TriageDecision.DEFER: "Defer (delay treatment)",
-                    TriageDecision.TRANSFER: "Transfer to another facility",
-                }[d],
-            )
-            decisions[pid] = choice
-            st.markdown("---")
-
-        submitted = st.form_submit_button("Apply Decisions And Resolve Round")
-
-    # Step 3: apply decisions and advance round
-    if submitted:
-        if decisions:
-            summary = apply_player_decisions(game_state, decisions)
-        else:
-            summary = RoundSummary(round_number=game_state.current_round)
-
-        game_state.add_round_summary(summary)
-        st.session_state.last_round_summary = summary
-
-        game_state.increment_round()
-        st.session_state.current_round_patient_ids = []
-        st.session_state.patients_generated_for_round = False
+    st.write(
+        "These patients have just arrived. Based on their visible "
+        "severity (which may be noisy), choose a triage decision for each."
+    )
 
-        st.rerun()
-    else:
-        if current_ids:
-            st.info(
-                "Set your decisions above and click "
-                "'Apply Decisions And Resolve Round'."
-            )
+    # Step 2: collect decisions in a form, as one table with a row per
+    # patient. Edits inside a form do not rerun the script; on submit,
+    # _resolve_round applies the decisions (step 3) before the next run.
+    form_key = f"triage_form_round_{game_state.current_round}"
+
+    with st.form(form_key):
+        st.data_editor(
+            [
+                {"Patient": row["label"], "Decision": _DEFAULT_TRIAGE_LABEL}
+                for row in round_view
+            ],
+            key=editor_key,
+            hide_index=True,
+            disabled=("Patient",),
+            column_config=_TRIAGE_COLUMNS,
+        )
+        st.form_submit_button(
+            "Apply Decisions And Resolve Round",
+            on_click=_resolve_round,
+            args=(bundle, editor_key),
+        )
+
+    st.info(
+        "Set your decisions above and click "
+        "'Apply Decisions And Resolve Round'."
+    )
 
 
 if __name__ == "__main__":